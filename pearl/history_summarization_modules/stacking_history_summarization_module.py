@@ -43,18 +43,14 @@ class StackingHistorySummarizationModule(HistorySummarizationModule):
         observation = assert_is_tensor_like(observation)
         action = assert_is_tensor_like(action)
         assert observation.shape[-1] + action.shape[-1] == self.history.shape[-1]
-        observation_action_pair = torch.cat(
-            (action, observation.view(1, -1)), dim=-1
-        ).detach()
-        self.history = torch.cat(
-            [
-                self.history[1:, :],
-                observation_action_pair.view(
-                    (1, self.action_dim + self.observation_dim)
-                ),
-            ],
-            dim=0,
-        )
+        # Fill a single new tensor in place instead of concatenating the
+        # (action, observation) pair and then the history.
+        # A new tensor is still needed because callers keep previous histories.
+        history = torch.empty_like(self.history)
+        history[:-1] = self.history[1:]
+        history[-1, : self.action_dim] = action.detach().view(-1)
+        history[-1, self.action_dim :] = observation.detach().view(-1)
+        self.history = history
         return self.history.view((-1))
 
     def get_history(self) -> torch.Tensor:
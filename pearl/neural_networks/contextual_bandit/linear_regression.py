@@ -17,7 +17,16 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 class LinearRegression(MuSigmaCBModel):
-    def __init__(self, feature_dim: int, l2_reg_lambda: float = 1.0) -> None:
+    # number of incremental (Woodbury) updates of inv_A after which it is recomputed
+    # from A, to bound the accumulation of floating point errors
+    max_incremental_inverse_updates: int = 100
+
+    def __init__(
+        self,
+        feature_dim: int,
+        l2_reg_lambda: float = 1.0,
+        rank: Optional[int] = None,
+    ) -> None:
         """
         A linear regression model which can estimate both point prediction and uncertainty
             (standard delivation).
@@ -28,10 +37,27 @@ class LinearRegression(MuSigmaCBModel):
         An extra column of ones is appended to the input data for the intercept where necessary.
             A user should not append a column of ones to the input data.
 
+        If `rank` is given, A^{-1} is approximated (scalable LinUCB) by keeping only the
+            top `rank` eigenpairs (U, s) of the data part of A, A - l2_reg_lambda * I:
+            A^{-1} ~= (I - U * diag(s / (s + l2_reg_lambda)) * U.t) / l2_reg_lambda
+            Updates then cost O(feature_dim * (rank + batch_size)^2) and uncertainty
+            estimates O(feature_dim * rank) per input, instead of O(feature_dim^3) and
+            O(feature_dim^2). Uncertainty along the discarded directions is
+            over-estimated, which keeps exploration optimistic.
+            A is still maintained (e.g. for Thompson sampling), but inv_A is not.
+
         feature_dim: number of features
         l2_reg_lambda: L2 regularization parameter
+        rank: optional rank of the low-rank approximation of A^{-1}
         """
         super(LinearRegression, self).__init__(feature_dim=feature_dim)
+        if rank is not None:
+            assert l2_reg_lambda > 0, "low-rank LinUCB requires l2_reg_lambda > 0"
+            assert (
+                0 < rank <= feature_dim + 1
+            ), f"rank must be in [1, {feature_dim + 1}], got {rank}"
+        self._l2_reg_lambda = l2_reg_lambda
+        self._rank = rank
         self.register_buffer(
             "_A",
             l2_reg_lambda * torch.eye(feature_dim + 1),  # +1 for intercept
@@ -43,7 +69,12 @@ class LinearRegression(MuSigmaCBModel):
             torch.zeros(feature_dim + 1, feature_dim + 1),
         )
         self.register_buffer("_coefs", torch.zeros(feature_dim + 1))
+        if rank is not None:
+            # top `rank` eigenpairs of A - l2_reg_lambda * I
+            self.register_buffer("_eigenvectors", torch.zeros(feature_dim + 1, rank))
+            self.register_buffer("_eigenvalues", torch.zeros(rank))
         self.distribution_enabled: bool = is_distribution_enabled()
+        self._num_incremental_inverse_updates = 0
 
     @property
     def A(self) -> torch.Tensor:
@@ -136,6 +167,22 @@ class LinearRegression(MuSigmaCBModel):
         """
         # this also appends a column of ones to `x`
         x, y, weight = self._validate_train_inputs(x, y, weight)
+        # A low-rank update of inv_A is cheaper than inverting A when the batch is
+        # smaller than the feature dimension. It needs the exact inverse of the
+        # previous A (only computed once something was learned, and only guaranteed
+        # to exist, rather than being a pseudo-inverse, when l2_reg_lambda > 0) and
+        # the local batch, so it is not used in distributed training where A is
+        # updated with all workers' data.
+        use_incremental_inverse = (
+            self._rank is None
+            and self._l2_reg_lambda > 0
+            and not self.distribution_enabled
+            and self._num_incremental_inverse_updates
+            < self.max_incremental_inverse_updates
+            and x.shape[0] < x.shape[1]
+            and self._sum_weight.item() > 0
+            and bool((weight >= 0).all())
+        )
 
         delta_A = torch.matmul(x.t(), x * weight)
         delta_b = torch.matmul(x.t(), y * weight).squeeze()
@@ -150,7 +197,16 @@ class LinearRegression(MuSigmaCBModel):
         self._b += delta_b.to(self._b.device)
         self._sum_weight += delta_sum_weight.to(self._sum_weight.device)
 
-        self.calculate_coefs()  # update coefs after updating A and b
+        # update coefs after updating A and b
+        if self._rank is not None:
+            self.update_low_rank_factors(x, weight)
+            self._coefs = self.low_rank_inv_A_matmul(self._b)
+        elif use_incremental_inverse:
+            self.update_inv_A(x, weight)
+            self._coefs = torch.matmul(self._inv_A, self._b)
+            self._num_incremental_inverse_updates += 1
+        else:
+            self.calculate_coefs()
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         # x can be [batch_size, feature_dim] or [batch_size, num_arms, feature_dim]
@@ -161,8 +217,11 @@ class LinearRegression(MuSigmaCBModel):
         x = x.reshape(-1, feature_dim)
 
         x = self.append_ones(x)
-        # dim: [batch_size, num_arms]
-        return torch.matmul(x, self.coefs.t()).reshape(batch_size, -1)
+        # always use the precision of the coefficients, even under autocast
+        with torch.autocast(device_type=x.device.type, enabled=False):
+            x = x.to(self.coefs.dtype)
+            # dim: [batch_size, num_arms]
+            return torch.matmul(x, self.coefs.t()).reshape(batch_size, -1)
 
     def calculate_coefs(self) -> None:
         """
@@ -171,6 +230,68 @@ class LinearRegression(MuSigmaCBModel):
         """
         self._inv_A = self.matrix_inv_fallback_pinv(self._A)
         self._coefs = torch.matmul(self._inv_A, self._b)
+        self._num_incremental_inverse_updates = 0
+
+    def update_inv_A(self, x: torch.Tensor, weight: torch.Tensor) -> None:
+        """
+        Update inverted A after A <- A + x.t * diag(weight) * x, with the
+        Sherman-Morrison-Woodbury formula (Sherman-Morrison for a single sample):
+        (A + U*U.t)^{-1} = A^{-1} - A^{-1}*U * (I + U.t*A^{-1}*U)^{-1} * U.t*A^{-1}
+        where U = x.t * diag(sqrt(weight)).
+        This costs O(feature_dim^2 * batch_size) instead of O(feature_dim^3).
+        x shape: (batch_size, feature_dim + 1), i.e. with the column of ones appended
+        weight shape: (batch_size, 1)
+        """
+        u = (x * weight.sqrt()).to(self._inv_A.device)  # rows are columns of U
+        # dim: [feature_dim + 1, batch_size]
+        inv_A_u = torch.matmul(self._inv_A, u.t())
+        # dim: [batch_size, batch_size]
+        identity = torch.eye(u.shape[0], dtype=u.dtype, device=u.device)
+        capacitance = identity + torch.matmul(u, inv_A_u)
+        # inv_A is symmetric, so U.t*A^{-1} = (A^{-1}*U).t
+        self._inv_A = self._inv_A - torch.matmul(
+            inv_A_u, torch.linalg.solve(capacitance, inv_A_u.t())
+        )
+
+    def update_low_rank_factors(self, x: torch.Tensor, weight: torch.Tensor) -> None:
+        """
+        Update the top `rank` eigenpairs (U, s) of A - l2_reg_lambda * I after
+        A <- A + x.t * diag(weight) * x.
+        With M = [U * diag(sqrt(s)), x.t * diag(sqrt(weight))], the new data part of A
+        is approximated by M * M.t. A thin QR decomposition M = Q * R (which also
+        re-orthogonalizes U) reduces its eigendecomposition to the one of the small
+        (rank + batch_size)^2 matrix R * R.t.
+        x shape: (batch_size, feature_dim + 1), i.e. with the column of ones appended
+        weight shape: (batch_size, 1)
+        """
+        rank = self._rank
+        assert rank is not None
+        assert (
+            not self.distribution_enabled
+        ), "low-rank LinUCB does not support distributed training"
+        assert bool((weight >= 0).all()), "low-rank LinUCB requires weights >= 0"
+        u = (x * weight.sqrt()).to(self._eigenvectors.device)
+        # dim: [feature_dim + 1, rank + batch_size]
+        m = torch.cat([self._eigenvectors * self._eigenvalues.sqrt(), u.t()], dim=1)
+        q, r = torch.linalg.qr(m)
+        # eigenvalues are in ascending order, keep the largest `rank` ones
+        eigenvalues, eigenvectors = torch.linalg.eigh(torch.matmul(r, r.t()))
+        self._eigenvalues = eigenvalues[-rank:].clamp(min=0)
+        self._eigenvectors = torch.matmul(q, eigenvectors[:, -rank:])
+
+    def _low_rank_shrinkage(self) -> torch.Tensor:
+        # dim: [rank]
+        return self._eigenvalues / (self._eigenvalues + self._l2_reg_lambda)
+
+    def low_rank_inv_A_matmul(self, v: torch.Tensor) -> torch.Tensor:
+        """
+        Compute A^{-1} * v with the low-rank approximation of A^{-1},
+        in O(feature_dim * rank).
+        v shape: (feature_dim + 1)
+        """
+        projection = torch.matmul(self._eigenvectors.t(), v)  # dim: [rank]
+        projection = self._low_rank_shrinkage() * projection
+        return (v - torch.matmul(self._eigenvectors, projection)) / self._l2_reg_lambda
 
     def calculate_sigma(self, x: torch.Tensor) -> torch.Tensor:
         # x can be [batch_size, feature_dim] or [batch_size, num_arms, feature_dim]
@@ -180,7 +301,15 @@ class LinearRegression(MuSigmaCBModel):
         # dim: [batch_size * num_arms, feature_dim]
         x = x.reshape(-1, feature_dim)
         x = self.append_ones(x)
-        sigma = torch.sqrt(self.batch_quadratic_form(x, self._inv_A))
+        if self._rank is not None:
+            # x.t * A^{-1} * x with the low-rank approximation of A^{-1}
+            projection = torch.matmul(x, self._eigenvectors)  # dim: [-1, rank]
+            quadratic_form = (
+                (x * x).sum(-1) - (projection**2 * self._low_rank_shrinkage()).sum(-1)
+            ) / self._l2_reg_lambda
+            sigma = torch.sqrt(quadratic_form.clamp(min=0))
+        else:
+            sigma = torch.sqrt(self.batch_quadratic_form(x, self._inv_A))
         return sigma.reshape(batch_size, -1)
 
     def __str__(self) -> str:
@@ -42,6 +42,7 @@ class LinearBandit(ContextualBanditBase):
         l2_reg_lambda: float = 1.0,
         training_rounds: int = 100,
         batch_size: int = 128,
+        rank: Optional[int] = None,
     ) -> None:
         super(LinearBandit, self).__init__(
             feature_dim=feature_dim,
@@ -50,7 +51,7 @@ class LinearBandit(ContextualBanditBase):
             exploration_module=exploration_module,
         )
         self.model = LinearRegression(
-            feature_dim=feature_dim, l2_reg_lambda=l2_reg_lambda
+            feature_dim=feature_dim, l2_reg_lambda=l2_reg_lambda, rank=rank
         )
 
     def learn_batch(self, batch: TransitionBatch) -> Dict[str, Any]:
@@ -58,6 +58,7 @@ class NeuralLinearBandit(ContextualBanditBase):
         batch_size: int = 128,
         learning_rate: float = 0.0003,
         l2_reg_lambda_linear: float = 1.0,
+        rank_linear: Optional[int] = None,
         state_features_only: bool = False,
         loss_type: str = "mse",  # one of the LOSS_TYPES names, e.g., mse, mae, xentropy
         output_activation_name: str = "linear",
@@ -67,7 +68,17 @@ class NeuralLinearBandit(ContextualBanditBase):
         last_activation: Optional[str] = None,
         dropout_ratio: float = 0.0,
         use_skip_connections: bool = False,
+        use_bf16_autocast: bool = False,
     ) -> None:
+        """
+        Args:
+            use_bf16_autocast: whether to run the neural network forward pass under
+                bfloat16 autocast during training, when training on a GPU.
+                Weights stay in FP32 (no gradient scaling is needed with bfloat16),
+                and the loss and the linear regression layer are computed in FP32
+                to preserve the conditioning of A.
+            See NeuralLinearRegression for the other arguments.
+        """
         assert (
             len(hidden_dims) >= 1
         ), "hidden_dims should have at least one value to specify feature dim for linear regression"
@@ -81,6 +92,7 @@ class NeuralLinearBandit(ContextualBanditBase):
             feature_dim=feature_dim,
             hidden_dims=hidden_dims,
             l2_reg_lambda_linear=l2_reg_lambda_linear,
+            rank_linear=rank_linear,
             output_activation_name=output_activation_name,
             use_batch_norm=use_batch_norm,
             use_layer_norm=use_layer_norm,
@@ -94,6 +106,7 @@ class NeuralLinearBandit(ContextualBanditBase):
         )
         self._state_features_only = state_features_only
         self.loss_type = loss_type
+        self._use_bf16_autocast = use_bf16_autocast
 
     @property
     def optimizer(self) -> torch.optim.Optimizer:
@@ -106,8 +119,14 @@ class NeuralLinearBandit(ContextualBanditBase):
             input_features = torch.cat([batch.state, batch.action], dim=1)
 
         # forward pass
-        model_ret = self.model.forward_with_intermediate_values(input_features)
-        predicted_values = model_ret["pred_label"]
+        device_type = input_features.device.type
+        with torch.autocast(
+            device_type=device_type,
+            dtype=torch.bfloat16,
+            enabled=self._use_bf16_autocast and device_type == "cuda",
+        ):
+            model_ret = self.model.forward_with_intermediate_values(input_features)
+        predicted_values = model_ret["pred_label"].float()
         expected_values = batch.reward
         batch_weight = batch.weight
 
@@ -128,7 +147,7 @@ class NeuralLinearBandit(ContextualBanditBase):
         self._optimizer.step()
         # Optimize linear regression
         self.model._linear_regression_layer.learn_batch(
-            model_ret["nn_output"].detach(),
+            model_ret["nn_output"].detach().float(),
             expected_values,
             batch_weight,
         )
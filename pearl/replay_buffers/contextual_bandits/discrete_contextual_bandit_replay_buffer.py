@@ -5,8 +5,7 @@
 # LICENSE file in the root directory of this source tree.
 #
 
-import random
-from typing import Optional
+from typing import List, Optional
 
 import torch
 
@@ -16,7 +15,7 @@ from pearl.api.reward import Reward
 from pearl.api.state import SubjectiveState
 
 from pearl.replay_buffers.tensor_based_replay_buffer import TensorBasedReplayBuffer
-from pearl.replay_buffers.transition import Transition, TransitionBatch
+from pearl.replay_buffers.transition import TransitionBatch
 from pearl.utils.tensor_like import assert_is_tensor_like
 
 
@@ -27,15 +26,83 @@ class DiscreteContextualBanditReplayBuffer(TensorBasedReplayBuffer):
     - No next action or next state related
     - action is action idx instead of action value
     - done is not needed, as for contextual bandit, it is always True
+
+    Transitions are stored in three contiguous ring-buffer tensors
+    (states, actions and rewards), allocated on the first push once the
+    state and action shapes are known. Sampling is a single gather over them.
+    The storage lives on the CPU; when the buffer's device is a GPU it is
+    allocated in pinned memory, and sampled batches are gathered into persistent
+    pinned staging buffers so that they are copied asynchronously.
     """
 
-    def __init__(self, capacity: int) -> None:
+    def __init__(self, capacity: int, device: Optional[torch.device] = None) -> None:
         super(DiscreteContextualBanditReplayBuffer, self).__init__(
             capacity=capacity,
             has_next_state=False,
             has_next_action=False,
             has_next_available_actions=False,
         )
+        if device is not None:
+            self.device = device
+        self._states: Optional[torch.Tensor] = None
+        self._actions: Optional[torch.Tensor] = None
+        self._rewards: Optional[torch.Tensor] = None
+        self._staging: Optional[List[torch.Tensor]] = None
+        self._staging_copied: Optional[torch.cuda.Event] = None
+        self._sample_idx: Optional[torch.Tensor] = None
+        self._ptr = 0
+        self._size = 0
+
+    @property
+    def _pin_memory(self) -> bool:
+        return self.device.type == "cuda" and torch.cuda.is_available()
+
+    def _allocate_storage(self, state: torch.Tensor, action: torch.Tensor) -> None:
+        pin_memory = self._pin_memory
+        # states are stored as floating point even if the first one is not (e.g. a
+        # list of ints), so that later states are not truncated
+        state_dtype = (
+            state.dtype if state.is_floating_point() else torch.get_default_dtype()
+        )
+        self._states = torch.empty(
+            (self.capacity, *state.shape), dtype=state_dtype, pin_memory=pin_memory
+        )
+        self._actions = torch.empty(
+            (self.capacity, *action.shape), dtype=action.dtype, pin_memory=pin_memory
+        )
+        self._rewards = torch.empty(self.capacity, pin_memory=pin_memory)
+
+    def _get_staging_buffers(self, batch_size: int) -> List[torch.Tensor]:
+        """
+        Returns persistent (pinned, when copying to a GPU) CPU buffers that sampled
+        batches are gathered into before being copied to `self.device`.
+        They are reallocated only when the batch size changes.
+        """
+        assert self._states is not None
+        assert self._actions is not None
+        assert self._rewards is not None
+        if self._staging_copied is not None:
+            # the previous asynchronous copy must be done reading the buffers
+            self._staging_copied.synchronize()
+            self._staging_copied = None
+        if self._staging is None or self._staging[0].shape[0] != batch_size:
+            pin_memory = self._pin_memory
+            self._staging = [
+                torch.empty(
+                    (batch_size, *x.shape[1:]), dtype=x.dtype, pin_memory=pin_memory
+                )
+                for x in (self._states, self._actions, self._rewards)
+            ]
+        return self._staging
+
+    def _sample_indices(self, batch_size: int) -> torch.Tensor:
+        """
+        Draws `batch_size` indices of stored transitions into a persistent index
+        tensor, reallocated only when the batch size changes.
+        """
+        if self._sample_idx is None or self._sample_idx.shape[0] != batch_size:
+            self._sample_idx = torch.empty(batch_size, dtype=torch.long)
+        return torch.randint(0, self._size, (batch_size,), out=self._sample_idx)
 
     def push(
         self,
@@ -52,18 +119,82 @@ class DiscreteContextualBanditReplayBuffer(TensorBasedReplayBuffer):
         # signature of push is the same as others, in order to match codes in PearlAgent
         # TODO add curr_available_actions and curr_available_actions_mask if needed in the future
         action = assert_is_tensor_like(action)
-        self.memory.append(
-            Transition(
-                state=self._process_single_state(state),
-                action=action,
-                reward=self._process_single_reward(reward),
-            ).to(self.device)
-        )
+        if not isinstance(state, torch.Tensor):
+            # e.g. Python lists, which cannot be assigned to a tensor row directly
+            state = torch.as_tensor(state)
+        if self._states is None:
+            self._allocate_storage(state, action)
+        assert self._states is not None
+        assert self._actions is not None
+        assert self._rewards is not None
+        # write in place into the preallocated rows: no per-push tensor allocation.
+        # States (e.g. from a history summarization module) may track gradients,
+        # detaching them keeps the storage out of their autograd graph.
+        self._states[self._ptr] = state.detach()
+        self._actions[self._ptr] = action.detach()
+        self._rewards[self._ptr] = reward
+        self._ptr = (self._ptr + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
 
     def sample(self, batch_size: int) -> TransitionBatch:
-        samples = random.sample(self.memory, batch_size)
-        return TransitionBatch(
-            state=torch.cat([x.state for x in samples]),
-            action=torch.stack([x.action for x in samples]),
-            reward=torch.cat([x.reward for x in samples]),
+        """
+        Samples `batch_size` transitions uniformly at random (with replacement).
+        As with the other replay buffers, `batch_size` must not exceed the number of
+        stored transitions.
+
+        The shapes of the output are:
+        TransitionBatch(
+          state = tensor(batch_size, state_dim),
+          action = tensor(batch_size, action_dim),
+          reward = tensor(batch_size, ),
+        )
+        """
+        if batch_size > len(self):
+            raise ValueError(
+                f"Can't get a batch of size {batch_size} from a replay buffer with"
+                f"only {len(self)} elements"
+            )
+        assert self._states is not None
+        assert self._actions is not None
+        assert self._rewards is not None
+        # the indices are only read by the gathers below, so they can be reused
+        idx = self._sample_indices(batch_size)
+        if self._states.device == self.device:
+            # the batch is handed to the caller, so it must not alias any buffer
+            return TransitionBatch(
+                state=self._states[idx],
+                action=self._actions[idx],
+                reward=self._rewards[idx],
+            )
+
+        state, action, reward = self._get_staging_buffers(batch_size)
+        torch.index_select(self._states, 0, idx, out=state)
+        torch.index_select(self._actions, 0, idx, out=action)
+        torch.index_select(self._rewards, 0, idx, out=reward)
+        batch = TransitionBatch(
+            state=state.to(self.device, non_blocking=True),
+            action=action.to(self.device, non_blocking=True),
+            reward=reward.to(self.device, non_blocking=True),
         ).to(self.device)
+        if state.is_pinned():
+            self._staging_copied = torch.cuda.Event()
+            self._staging_copied.record(torch.cuda.current_stream(self.device))
+        return batch
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        super(DiscreteContextualBanditReplayBuffer, self).clear()
+        if self._staging_copied is not None:
+            # the staging buffers may still be read by an asynchronous copy
+            self._staging_copied.synchronize()
+        # storage is allocated again on the next push, which may have other shapes
+        self._states = None
+        self._actions = None
+        self._rewards = None
+        self._staging = None
+        self._staging_copied = None
+        self._sample_idx = None
+        self._ptr = 0
+        self._size = 0
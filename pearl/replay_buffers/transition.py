@@ -6,13 +6,27 @@
 #
 
 import dataclasses
+import functools
 from dataclasses import dataclass
-from typing import Optional, TypeVar
+from typing import Any, Optional, Tuple, TypeVar
 
 import torch
 from torch import Tensor
 
 
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """
+    Names of the fields of a dataclass, computed once per class
+    (`dataclasses.fields` rebuilds this list on every call).
+    """
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
+def _is_on_device(item: Any, device: torch.device) -> bool:
+    return isinstance(item, torch.Tensor) and item.device == device
+
+
 T = TypeVar("T", bound="Transition")
 
 
@@ -38,11 +52,13 @@ class Transition:
 
     def to(self: T, device: torch.device) -> T:
         # iterate over all fields, move to correct device
-        for f in dataclasses.fields(self.__class__):
-            if getattr(self, f.name) is not None:
+        # tensors already on the device are left as is
+        for name in _field_names(self.__class__):
+            item = getattr(self, name)
+            if item is not None and not _is_on_device(item, device):
                 super().__setattr__(
-                    f.name,
-                    torch.as_tensor(getattr(self, f.name)).to(device),
+                    name,
+                    torch.as_tensor(item).to(device),
                 )
         return self
 
@@ -77,12 +93,13 @@ class TransitionBatch:
 
     def to(self: TB, device: torch.device) -> TB:
         # iterate over all fields
-        for f in dataclasses.fields(self.__class__):
-            if getattr(self, f.name) is not None:
-                item = getattr(self, f.name)
+        # tensors already on the device are left as is
+        for name in _field_names(self.__class__):
+            item = getattr(self, name)
+            if item is not None and not _is_on_device(item, device):
                 item = torch.as_tensor(item, device=device)
                 super().__setattr__(
-                    f.name,
+                    name,
                     item,
                 )
         return self
@@ -126,7 +126,7 @@ def concatenate_actions_to_state(
         return expanded_state
 
     # Stack actions and expand to (batch_size, action_count, action_dim)
-    actions = torch.stack(action_space.actions).to(subjective_state.device)
+    actions = action_space.actions_batch.to(subjective_state.device)
     # Apply action transformation (default is the identity transformation)
     actions = action_representation_module(actions)
     expanded_action = actions.unsqueeze(0).repeat(batch_size, 1, 1)
@@ -22,7 +22,7 @@ There are 2 versions in this file:
 import math
 import random
 from abc import abstractmethod
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 
 import torch
 
@@ -45,9 +45,13 @@ class SparseRewardEnvironment(Environment):
         self._length = length
         self._height = height
         self._max_episode_duration = max_episode_duration
+        # bounds of the arena, used to clip the agent position
+        self._lower_bounds: torch.Tensor = torch.zeros(2)
+        self._upper_bounds: torch.Tensor = torch.tensor([length, height])
         # reset will initialize following
-        self._agent_position: Optional[Tuple[float, float]] = None
+        self._agent_position: Optional[torch.Tensor] = None
         self._goal: Optional[Tuple[float, float]] = None
+        self._goal_tensor: Optional[torch.Tensor] = None
         self._step_count = 0
         self._reward_distance = reward_distance
 
@@ -58,28 +62,42 @@ class SparseRewardEnvironment(Environment):
     def reset(self, seed: Optional[int] = None) -> Tuple[torch.Tensor, ActionSpace]:
 
         # reset (x, y)
-        self._agent_position = (self._length / 2, self._height / 2)
+        self._agent_position = torch.tensor([self._length / 2, self._height / 2])
         self._goal = (random.uniform(0, self._length), random.uniform(0, self._height))
+        self._goal_tensor = torch.tensor(self._goal)
         self._step_count = 0
+        return (self._observation(), self.action_space)
+
+    def _observation(self) -> torch.Tensor:
+        """
+        Return:
+            a new tensor (x, y, goal_x, goal_y)
+        """
         assert self._agent_position is not None
-        assert (goal := self._goal) is not None
-        return (
-            torch.tensor(list(self._agent_position) + list(goal)),
-            self.action_space,
-        )
+        assert self._goal_tensor is not None
+        return torch.cat([self._agent_position, self._goal_tensor])
 
-    def _update_position(self, delta: Tuple[float, float]) -> None:
+    def _update_position(self, delta: torch.Tensor) -> None:
         """
         This API is to update and clip and ensure agent always stay in map
         """
-        delta_x, delta_y = delta
         assert self._agent_position is not None
-        x, y = self._agent_position
-        self._agent_position = (
-            max(min(x + delta_x, self._length), 0),
-            max(min(y + delta_y, self._height), 0),
+        self._agent_position.add_(delta.to(self._agent_position.device)).clamp_(
+            min=self._lower_bounds, max=self._upper_bounds
         )
 
+    def _reached_goal(self, positions: torch.Tensor) -> torch.Tensor:
+        """
+        Args:
+            positions: a tensor of shape (..., 2), e.g. (M, 2) for M agents
+        Return:
+            a boolean tensor of shape (...), True where the position is within
+            reward distance of the goal
+        """
+        assert self._goal_tensor is not None
+        squared_distance = ((positions - self._goal_tensor) ** 2).sum(dim=-1)
+        return squared_distance < self._reward_distance**2
+
     def _check_win(self) -> bool:
         """
         Return:
@@ -87,10 +105,7 @@ class SparseRewardEnvironment(Environment):
             False if not reached goal
         """
         assert self._agent_position is not None
-        assert self._goal is not None
-        if math.dist(self._agent_position, self._goal) < self._reward_distance:
-            return True
-        return False
+        return bool(self._reached_goal(self._agent_position))
 
 
 class ContinuousSparseRewardEnvironment(SparseRewardEnvironment):
@@ -101,15 +116,13 @@ class ContinuousSparseRewardEnvironment(SparseRewardEnvironment):
 
     def step(self, action: Action) -> ActionResult:
         assert isinstance(action, torch.Tensor)
-        self._update_position((action[0].item(), action[1].item()))
+        self._update_position(action[:2])
 
         has_win = self._check_win()
         self._step_count += 1
         terminated = has_win or self._step_count >= self._max_episode_duration
-        assert self._agent_position is not None
-        assert (goal := self._goal) is not None
         return ActionResult(
-            observation=torch.tensor(list(self._agent_position) + list(goal)),
+            observation=self._observation(),
             reward=0 if has_win else -1,
             terminated=terminated,
             truncated=False,
@@ -148,16 +161,15 @@ class DiscreteSparseRewardEnvironment(ContinuousSparseRewardEnvironment):
         )
         self._step_size = step_size
         self._action_count = action_count
-        self._actions: List[torch.Tensor] = [
-            torch.tensor(
-                [
-                    math.cos(2 * math.pi / self._action_count * i),
-                    math.sin(2 * math.pi / self._action_count * i),
-                ]
-            )
-            * self._step_size
-            for i in range(action_count)
-        ]
+        # (action_count, 2) tensor whose n-th row is the position delta of action n.
+        # Angles are computed in double precision so that axis-aligned deltas
+        # have (numerically) zero components, e.g. cos(pi / 2).
+        angles = torch.arange(action_count, dtype=torch.float64) * (
+            2 * math.pi / action_count
+        )
+        self._actions: torch.Tensor = (
+            torch.stack([angles.cos(), angles.sin()], dim=1) * step_size
+        ).float()
 
     def step(self, action: Action) -> ActionResult:
         assert action < self._action_count and action >= 0
@@ -165,6 +177,16 @@ class DiscreteSparseRewardEnvironment(ContinuousSparseRewardEnvironment):
             self._actions[int(action.item())]
         )
 
+    @property
+    def action_deltas(self) -> torch.Tensor:
+        """
+        Position deltas of all actions as a tensor of shape (action_count, 2),
+        where row n is the delta of action n.
+        Indexing it with a batch of action indices gives the deltas of the whole
+        batch at once, e.g. for vectorized policy evaluation.
+        """
+        return self._actions
+
     @property
     def action_space(self) -> DiscreteActionSpace:
         return DiscreteActionSpace(
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import torch
 from pearl.api.action import Action
@@ -41,19 +41,32 @@ class DiscreteActionSpace(DiscreteSpace, ActionSpace):
     `DiscreteActionSpace` is based on PyTorch tensors instead of NumPy arrays.
     """
 
-    def __init__(self, actions: List[Action], seed: Optional[int] = None) -> None:
+    def __init__(
+        self, actions: Union[List[Action], Tensor], seed: Optional[int] = None
+    ) -> None:
         """Contructs a `DiscreteActionSpace`.
 
         Args:
-            actions: A list of possible `Action` objects.
+            actions: A list of possible `Action` objects, or a Tensor of shape
+                `(n, d)` (or `(n,)` for scalar actions) whose rows are the actions.
+                A Tensor is used as is, without being split and stacked again.
             seed: Random seed used to initialize the random number generator of the
                 underlying Gym `Discrete` space.
         """
+        self._actions_batch: Optional[Tensor] = None
         super(DiscreteActionSpace, self).__init__(elements=actions, seed=seed)
 
-    def _set_validated_elements(self, elements: List[Tensor]) -> None:
+    def _set_validated_elements(self, elements: Union[List[Tensor], Tensor]) -> None:
         """Creates the set of actions after validating that a action is a Tensor of
         shape `d` and all actions have the same shape."""
+        if isinstance(elements, Tensor):
+            # rows of a single Tensor all have the same shape
+            actions_batch = elements.detach()
+            if actions_batch.dim() == 1:
+                actions_batch = actions_batch.unsqueeze(-1)
+            self._actions_batch = actions_batch.view(actions_batch.shape[0], -1)
+            self.elements = list(self._actions_batch.unbind(dim=0))
+            return
         # Allow scalar or (1, d) Tensors, but reshape them to (d,).
         # Use the first action's shape to compute the expected shape.
         validated_actions = []
@@ -77,7 +90,9 @@ class DiscreteActionSpace(DiscreteSpace, ActionSpace):
     def actions_batch(self) -> Tensor:
         """Returns a tensor of shape `(b, d)` with each row corresponding to an
         `Action` object from this action space."""
-        return torch.stack(self.actions, dim=0)
+        if self._actions_batch is None:
+            self._actions_batch = torch.stack(self.actions, dim=0)
+        return self._actions_batch
 
     @property
     def action_dim(self) -> int:
@@ -106,5 +121,5 @@ class DiscreteActionSpace(DiscreteSpace, ActionSpace):
         )
 
     def to(self, device: torch.device) -> None:
-        for i, action in enumerate(self.actions):
-            self.actions[i] = action.to(device)
+        self._actions_batch = self.actions_batch.to(device)
+        self.elements = list(self._actions_batch.unbind(dim=0))
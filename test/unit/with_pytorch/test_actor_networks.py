@@ -0,0 +1,138 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+
+import torch
+from pearl.neural_networks.sequential_decision_making.actor_networks import (
+    configure_backends,
+    VanillaActorNetwork,
+    VanillaContinuousActorNetwork,
+)
+from pearl.utils.instantiations.spaces.box_action import BoxActionSpace
+
+from ...utils import RUN_TORCH_COMPILE_TESTS
+
+
+class TestActorNetworks(unittest.TestCase):
+    def setUp(self) -> None:
+        self.batch_size = 6
+        self.input_dim = 15
+        self.hidden_dims = [16, 16]
+        self.output_dim = 4
+
+    def test_configure_backends(self) -> None:
+        allow_tf32 = torch.backends.cuda.matmul.allow_tf32
+        try:
+            # importing actor networks must not change the process-wide setting
+            self.assertFalse(allow_tf32)
+            configure_backends()
+            self.assertTrue(torch.backends.cuda.matmul.allow_tf32)
+        finally:
+            torch.backends.cuda.matmul.allow_tf32 = allow_tf32
+
+    @unittest.skipUnless(
+        RUN_TORCH_COMPILE_TESTS, "set PEARL_TEST_TORCH_COMPILE=1 to run"
+    )
+    def test_compiled_vanilla_actor_network(self) -> None:
+        network = VanillaActorNetwork(
+            input_dim=self.input_dim,
+            hidden_dims=self.hidden_dims,
+            output_dim=self.output_dim,
+        )
+        compiled_network = VanillaActorNetwork.compiled(
+            input_dim=self.input_dim,
+            hidden_dims=self.hidden_dims,
+            output_dim=self.output_dim,
+        )
+        # compiling in place must not change parameter names
+        compiled_network.load_state_dict(network.state_dict())
+
+        x = torch.randn(self.batch_size, self.input_dim)
+        self.assertTrue(
+            torch.allclose(
+                network.get_policy_distribution(x),
+                compiled_network.get_policy_distribution(x),
+                atol=1e-6,
+            )
+        )
+
+    @unittest.skipUnless(
+        RUN_TORCH_COMPILE_TESTS, "set PEARL_TEST_TORCH_COMPILE=1 to run"
+    )
+    def test_compiled_vanilla_actor_network_new_shape(self) -> None:
+        compiled_network = VanillaActorNetwork.compiled(
+            input_dim=self.input_dim,
+            hidden_dims=self.hidden_dims,
+            output_dim=self.output_dim,
+            mode="default",
+        )
+        # shape-specialized code is recompiled for a different batch size
+        for batch_size in [self.batch_size, 1, self.batch_size]:
+            x = torch.randn(batch_size, self.input_dim)
+            self.assertEqual(compiled_network(x).shape, (batch_size, self.output_dim))
+
+    def test_scripted_vanilla_actor_network(self) -> None:
+        network = VanillaActorNetwork(
+            input_dim=self.input_dim,
+            hidden_dims=self.hidden_dims,
+            output_dim=self.output_dim,
+        )
+        scripted_network = VanillaActorNetwork.scripted(
+            input_dim=self.input_dim,
+            hidden_dims=self.hidden_dims,
+            output_dim=self.output_dim,
+        )
+        self.assertIsInstance(scripted_network, torch.jit.ScriptModule)
+        scripted_network.load_state_dict(network.state_dict())
+
+        x = torch.randn(self.batch_size, self.input_dim)
+        self.assertTrue(torch.allclose(network(x), scripted_network(x), atol=1e-6))
+        self.assertTrue(
+            torch.allclose(
+                network.get_policy_distribution(x),
+                scripted_network.get_policy_distribution(x),
+                atol=1e-6,
+            )
+        )
+        actions = torch.nn.functional.one_hot(
+            torch.randint(self.output_dim, (self.batch_size,)), self.output_dim
+        ).float()
+        self.assertTrue(
+            torch.allclose(
+                network.get_action_prob(x, actions),
+                scripted_network.get_action_prob(x, actions),
+                atol=1e-6,
+            )
+        )
+
+    def test_scripted_vanilla_continuous_actor_network(self) -> None:
+        action_space = BoxActionSpace(
+            low=torch.full((self.output_dim,), -2.0),
+            high=torch.full((self.output_dim,), 3.0),
+        )
+        network = VanillaContinuousActorNetwork(
+            input_dim=self.input_dim,
+            hidden_dims=self.hidden_dims,
+            output_dim=self.output_dim,
+            action_space=action_space,
+        )
+        scripted_network = VanillaContinuousActorNetwork.scripted(
+            input_dim=self.input_dim,
+            hidden_dims=self.hidden_dims,
+            output_dim=self.output_dim,
+            action_space=action_space,
+        )
+        self.assertIsInstance(scripted_network, torch.jit.ScriptModule)
+        scripted_network.load_state_dict(network.state_dict())
+
+        x = torch.randn(self.batch_size, self.input_dim)
+        self.assertTrue(torch.allclose(network(x), scripted_network(x), atol=1e-6))
+        # sample_action is left in Python, on top of the scripted forward
+        action = scripted_network.sample_action(x)
+        self.assertTrue(torch.allclose(network.sample_action(x), action, atol=1e-6))
+        self.assertTrue(torch.all(action >= -2.0) and torch.all(action <= 3.0))
@@ -18,3 +18,18 @@ class TestDiscreteActionSpace(unittest.TestCase):
         action_space = DiscreteActionSpace(actions=actions)
         for i, action in enumerate(action_space):
             self.assertTrue(torch.equal(actions[i], action))
+
+    def test_tensor_actions(self) -> None:
+        # 5 actions with dimention as 4, given as a single (5, 4) tensor
+        actions = torch.randn(5, 4)
+        action_space = DiscreteActionSpace(actions=actions)
+        self.assertEqual(action_space.n, 5)
+        self.assertEqual(action_space.action_dim, 4)
+        self.assertTrue(torch.equal(action_space.actions_batch, actions))
+        for i, action in enumerate(action_space):
+            self.assertTrue(torch.equal(actions[i], action))
+
+        # scalar actions given as a (5,) tensor are reshaped to (5, 1)
+        action_space = DiscreteActionSpace(actions=torch.arange(5))
+        self.assertEqual(action_space.actions_batch.shape, (5, 1))
+        self.assertEqual(action_space.action_dim, 1)
@@ -0,0 +1,238 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import unittest
+
+import torch
+
+from pearl.replay_buffers.contextual_bandits.discrete_contextual_bandit_replay_buffer import (
+    DiscreteContextualBanditReplayBuffer,
+)
+from pearl.utils.instantiations.spaces.discrete_action import DiscreteActionSpace
+
+
+class TestDiscreteContextualBanditReplayBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state_dim = 5
+        self.action_dim = 3
+        self.action_space = DiscreteActionSpace(
+            actions=[torch.tensor([i]) for i in range(self.action_dim)]
+        )
+
+    def _push(
+        self,
+        replay_buffer: DiscreteContextualBanditReplayBuffer,
+        state: torch.Tensor,
+        action: torch.Tensor,
+        reward: float,
+    ) -> None:
+        replay_buffer.push(
+            state=state,
+            action=action,
+            reward=reward,
+            next_state=None,
+            curr_available_actions=self.action_space,
+            next_available_actions=self.action_space,
+            done=True,
+        )
+
+    def test_push_and_sample(self) -> None:
+        replay_buffer = DiscreteContextualBanditReplayBuffer(capacity=10)
+        for i in range(4):
+            self._push(
+                replay_buffer,
+                state=torch.full((self.state_dim,), float(i)),
+                action=torch.tensor([i % self.action_dim]),
+                reward=float(i),
+            )
+        self.assertEqual(len(replay_buffer), 4)
+
+        batch = replay_buffer.sample(4)
+        self.assertEqual(batch.state.shape, (4, self.state_dim))
+        self.assertEqual(batch.action.shape, (4, 1))
+        self.assertEqual(batch.reward.shape, (4,))
+        # each sampled row must be a transition that was pushed
+        for state, action, reward in zip(batch.state, batch.action, batch.reward):
+            i = int(reward.item())
+            self.assertTrue(torch.equal(state, torch.full((self.state_dim,), float(i))))
+            self.assertEqual(action.item(), i % self.action_dim)
+
+        with self.assertRaises(ValueError):
+            replay_buffer.sample(5)
+
+    def test_capacity_overwrites_oldest(self) -> None:
+        capacity = 3
+        replay_buffer = DiscreteContextualBanditReplayBuffer(capacity=capacity)
+        for i in range(5):
+            self._push(
+                replay_buffer,
+                state=torch.full((self.state_dim,), float(i)),
+                action=torch.tensor([0]),
+                reward=float(i),
+            )
+        self.assertEqual(len(replay_buffer), capacity)
+        sampled_rewards = set()
+        for _ in range(20):
+            sampled_rewards |= set(replay_buffer.sample(capacity).reward.tolist())
+        self.assertTrue(sampled_rewards <= {2.0, 3.0, 4.0})
+        with self.assertRaises(ValueError):
+            replay_buffer.sample(capacity + 1)
+
+        replay_buffer.clear()
+        self.assertEqual(len(replay_buffer), 0)
+
+        # after clear, transitions with a different state shape can be pushed
+        self._push(
+            replay_buffer,
+            state=torch.ones(self.state_dim + 2),
+            action=torch.tensor([1]),
+            reward=1.0,
+        )
+        batch = replay_buffer.sample(1)
+        self.assertTrue(torch.equal(batch.state, torch.ones(1, self.state_dim + 2)))
+        self.assertEqual(batch.action.item(), 1)
+
+    def test_consecutive_samples_of_different_sizes(self) -> None:
+        replay_buffer = DiscreteContextualBanditReplayBuffer(capacity=10)
+        for i in range(10):
+            self._push(
+                replay_buffer,
+                state=torch.full((self.state_dim,), float(i)),
+                action=torch.tensor([0]),
+                reward=float(i),
+            )
+        first_batch = replay_buffer.sample(8)
+        first_rewards = first_batch.reward.clone()
+        for batch_size in [8, 3, 8]:
+            batch = replay_buffer.sample(batch_size)
+            self.assertEqual(batch.reward.shape, (batch_size,))
+            self.assertTrue(torch.equal(batch.state[:, 0], batch.reward))
+        # later samples must not overwrite a batch handed out earlier
+        self.assertTrue(torch.equal(first_batch.reward, first_rewards))
+
+    def test_sample_on_device(self) -> None:
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        replay_buffer = DiscreteContextualBanditReplayBuffer(capacity=4, device=device)
+        self.assertEqual(replay_buffer.device, device)
+        for i in range(4):
+            self._push(
+                replay_buffer,
+                state=torch.full((self.state_dim,), float(i)),
+                action=torch.tensor([1]),
+                reward=float(i),
+            )
+        batch = replay_buffer.sample(2)
+        self.assertEqual(batch.state.device.type, device.type)
+        self.assertEqual(batch.action.device.type, device.type)
+        self.assertEqual(batch.reward.device.type, device.type)
+        self.assertTrue(torch.equal(batch.state[:, 0], batch.reward))
+
+    def test_push_python_values(self) -> None:
+        replay_buffer = DiscreteContextualBanditReplayBuffer(capacity=2)
+        replay_buffer.push(
+            state=[1.0] * self.state_dim,
+            action=torch.tensor([2]),
+            reward=3,
+            next_state=None,
+            curr_available_actions=self.action_space,
+            next_available_actions=self.action_space,
+            done=True,
+        )
+        batch = replay_buffer.sample(1)
+        self.assertTrue(torch.equal(batch.state, torch.ones(1, self.state_dim)))
+        self.assertEqual(batch.action.item(), 2)
+        self.assertEqual(batch.reward.item(), 3.0)
+
+    def test_push_integer_state_first(self) -> None:
+        replay_buffer = DiscreteContextualBanditReplayBuffer(capacity=2)
+        replay_buffer.push(
+            state=[1, 2, 3],
+            action=torch.tensor([0]),
+            reward=0,
+            next_state=None,
+            curr_available_actions=self.action_space,
+            next_available_actions=self.action_space,
+            done=True,
+        )
+        self._push(
+            replay_buffer,
+            state=torch.tensor([0.5, 1.5, 2.5]),
+            action=torch.tensor([0]),
+            reward=1.0,
+        )
+        # a floating point state pushed after an integer one must not be truncated
+        batch = replay_buffer.sample(2)
+        self.assertTrue(batch.state.is_floating_point())
+        for state, reward in zip(batch.state, batch.reward):
+            expected_state = [[1.0, 2.0, 3.0], [0.5, 1.5, 2.5]][int(reward.item())]
+            self.assertEqual(state.tolist(), expected_state)
+
+    def test_push_state_requiring_grad(self) -> None:
+        replay_buffer = DiscreteContextualBanditReplayBuffer(capacity=2)
+        weight = torch.ones(self.state_dim, requires_grad=True)
+        self._push(
+            replay_buffer,
+            state=torch.ones(self.state_dim) * weight,
+            action=torch.tensor([0]),
+            reward=1.0,
+        )
+        # the storage must not join the autograd graph of pushed states
+        self.assertFalse(replay_buffer.sample(1).state.requires_grad)
+
+    def test_consecutive_samples_through_staging_buffers(self) -> None:
+        # "cpu:0" is not equal to the device of the (plain "cpu") storage, so sampling
+        # goes through the staging buffers, as when sampling to a GPU
+        replay_buffer = DiscreteContextualBanditReplayBuffer(
+            capacity=10, device=torch.device("cpu", 0)
+        )
+        for i in range(10):
+            self._push(
+                replay_buffer,
+                state=torch.full((self.state_dim,), float(i)),
+                action=torch.tensor([i % self.action_dim]),
+                reward=float(i),
+            )
+        first_batch = replay_buffer.sample(8)
+        # FIXME: private attributes should not be accessed.
+        self.assertIsNotNone(replay_buffer._staging)
+        first_rewards = first_batch.reward.clone()
+        for batch_size in [8, 3, 8]:
+            batch = replay_buffer.sample(batch_size)
+            # staging buffers are reallocated when the batch size changes
+            assert (staging := replay_buffer._staging) is not None
+            self.assertEqual(staging[0].shape, (batch_size, self.state_dim))
+            self.assertEqual(batch.state.shape, (batch_size, self.state_dim))
+            self.assertEqual(batch.action.shape, (batch_size, 1))
+            self.assertEqual(batch.reward.shape, (batch_size,))
+            self.assertTrue(torch.equal(batch.state[:, 0], batch.reward))
+            expected_action = batch.reward.long() % self.action_dim
+            self.assertTrue(torch.equal(batch.action.view(-1), expected_action))
+        # a batch handed out earlier is not overwritten by later samples
+        self.assertTrue(torch.equal(first_batch.reward, first_rewards))
+        self.assertTrue(torch.equal(first_batch.state[:, 0], first_rewards))
+
+    @unittest.skipUnless(torch.cuda.is_available(), "requires a GPU")
+    def test_consecutive_samples_on_gpu(self) -> None:
+        replay_buffer = DiscreteContextualBanditReplayBuffer(
+            capacity=10, device=torch.device("cuda")
+        )
+        for i in range(10):
+            self._push(
+                replay_buffer,
+                state=torch.full((self.state_dim,), float(i)),
+                action=torch.tensor([0]),
+                reward=float(i),
+            )
+        first_batch = replay_buffer.sample(8)
+        first_rewards = first_batch.reward.clone()
+        second_batch = replay_buffer.sample(8)
+        # batches are copied out of the staging buffers, so they do not alias them
+        self.assertTrue(torch.equal(first_batch.reward, first_rewards))
+        for batch in (first_batch, second_batch):
+            self.assertTrue(
+                torch.equal(batch.state[:, 0], batch.reward),
+            )
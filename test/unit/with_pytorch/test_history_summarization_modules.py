@@ -39,6 +39,31 @@ class TestHistorySummarizationModules(unittest.TestCase):
                 subjective_state.shape[0],
                 self.history_length * (self.action_dim + self.observation_dim),
             )
+            # the latest (action, observation) pair is the last row of the history
+            self.assertTrue(
+                torch.equal(
+                    subjective_state[-(self.action_dim + self.observation_dim) :],
+                    torch.cat((action, observation), dim=-1).view(-1),
+                )
+            )
+
+    def test_stacking_history_summarizer_keeps_previous_histories(self) -> None:
+        summarization_module = StackingHistorySummarizationModule(
+            self.observation_dim, self.action_dim, self.history_length
+        )
+        previous_state = summarization_module.summarize_history(
+            torch.rand((1, self.observation_dim)), torch.rand((1, self.action_dim))
+        )
+        previous_state_copy = previous_state.clone()
+        subjective_state = summarization_module.summarize_history(
+            torch.rand((1, self.observation_dim)), torch.rand((1, self.action_dim))
+        )
+        # summarizing a new observation must not modify a previously returned state
+        self.assertTrue(torch.equal(previous_state, previous_state_copy))
+        pair_dim = self.action_dim + self.observation_dim
+        self.assertTrue(
+            torch.equal(subjective_state[:-pair_dim], previous_state[pair_dim:])
+        )
 
     def test_lstm_history_summarizer(self) -> None:
         """
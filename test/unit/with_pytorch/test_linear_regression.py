@@ -54,6 +54,110 @@ class TestLinearRegression(unittest.TestCase):
         self.assertGreater(sum(losses[:5]), sum(losses[-5:]))
         self.assertGreater(1e-2, losses[-1])
 
+    def test_incremental_inverse(self) -> None:
+        feature_dim: int = 15
+        linear_regression = LinearRegression(feature_dim=feature_dim)
+        # small batches (including single samples) use low-rank updates of inv_A
+        for batch_size in [20, 1, 4, 1, 8]:
+            feature = torch.randn(batch_size, feature_dim)
+            reward = feature.sum(-1, keepdim=True)
+            weight = torch.rand(batch_size, 1)
+            linear_regression.learn_batch(x=feature, y=reward, weight=weight)
+
+        self.assertTrue(
+            torch.allclose(
+                linear_regression._inv_A,
+                torch.linalg.inv(linear_regression.A),
+                atol=1e-5,
+            )
+        )
+        self.assertTrue(
+            torch.allclose(
+                linear_regression.coefs,
+                torch.linalg.solve(linear_regression.A, linear_regression._b),
+                atol=1e-4,
+            )
+        )
+
+    def test_incremental_inverse_without_regularization(self) -> None:
+        feature_dim: int = 15
+        batch_size: int = 2
+        linear_regression = LinearRegression(feature_dim=feature_dim, l2_reg_lambda=0)
+        # A stays singular for a while, so inv_A is a pseudo-inverse which must not
+        # be updated incrementally
+        for _ in range(30):
+            feature = torch.randn(batch_size, feature_dim)
+            reward = feature.sum(-1, keepdim=True)
+            linear_regression.learn_batch(
+                x=feature, y=reward, weight=torch.ones(batch_size, 1)
+            )
+
+        self.assertTrue(
+            torch.allclose(
+                linear_regression.coefs,
+                torch.cat([torch.zeros(1), torch.ones(feature_dim)]),
+                atol=1e-3,
+            )
+        )
+        sigma = linear_regression.calculate_sigma(torch.randn(batch_size, feature_dim))
+        self.assertFalse(torch.isnan(sigma).any())
+
+    def test_incremental_inverse_refresh(self) -> None:
+        feature_dim: int = 15
+        linear_regression = LinearRegression(feature_dim=feature_dim)
+        num_updates = 2 * LinearRegression.max_incremental_inverse_updates + 10
+        for _ in range(num_updates):
+            feature = torch.randn(1, feature_dim)
+            reward = feature.sum(-1, keepdim=True)
+            linear_regression.learn_batch(
+                x=feature, y=reward, weight=torch.ones(1, 1)
+            )
+        # inv_A is recomputed from A once the maximum number of updates is reached
+        self.assertLessEqual(
+            linear_regression._num_incremental_inverse_updates,
+            LinearRegression.max_incremental_inverse_updates,
+        )
+        self.assertTrue(
+            torch.allclose(
+                linear_regression.coefs,
+                torch.linalg.solve(linear_regression.A, linear_regression._b),
+                atol=1e-4,
+            )
+        )
+
+    def test_low_rank_sigma(self) -> None:
+        feature_dim: int = 15
+        batch_size: int = 4
+        exact_model = LinearRegression(feature_dim=feature_dim)
+        full_rank_model = LinearRegression(
+            feature_dim=feature_dim, rank=feature_dim + 1
+        )
+        low_rank_model = LinearRegression(feature_dim=feature_dim, rank=4)
+        for _ in range(10):
+            feature = torch.randn(batch_size, feature_dim)
+            reward = feature.sum(-1, keepdim=True)
+            weight = torch.ones(batch_size, 1)
+            for model in (exact_model, full_rank_model, low_rank_model):
+                model.learn_batch(x=feature, y=reward, weight=weight)
+
+        feature = torch.randn(batch_size, feature_dim)
+        exact_sigma = exact_model.calculate_sigma(feature)
+        # without truncation, the factorization is exact
+        self.assertTrue(
+            torch.allclose(
+                full_rank_model.calculate_sigma(feature), exact_sigma, atol=1e-4
+            )
+        )
+        # coefficients are O(1), both models accumulate float32 errors
+        self.assertTrue(
+            torch.allclose(full_rank_model.coefs, exact_model.coefs, atol=1e-3)
+        )
+        # truncation can only over-estimate the uncertainty
+        self.assertTrue(
+            torch.all(low_rank_model.calculate_sigma(feature) >= exact_sigma - 1e-4)
+        )
+        self.assertTrue(torch.equal(low_rank_model.A, exact_model.A))
+
     def test_state_dict(self) -> None:
         feature_dim = 15
         model = LinearRegression(feature_dim=feature_dim)
@@ -6,9 +6,13 @@
 #
 
 import unittest
+from typing import List, Tuple
 
 import torch
 from pearl.neural_networks.common.residual_wrapper import ResidualWrapper
+from pearl.neural_networks.sequential_decision_making.actor_networks import (
+    compile_function,
+)
 from pearl.policy_learners.contextual_bandits.neural_bandit import LOSS_TYPES
 from pearl.policy_learners.contextual_bandits.neural_linear_bandit import (
     NeuralLinearBandit,
@@ -19,6 +23,8 @@ from pearl.policy_learners.exploration_modules.contextual_bandits.ucb_exploratio
 from pearl.replay_buffers.transition import TransitionBatch
 from pearl.utils.instantiations.spaces.discrete_action import DiscreteActionSpace
 
+from ...utils import RUN_TORCH_COMPILE_TESTS
+
 NUM_EPOCHS = 1000
 
 
@@ -90,6 +96,55 @@ class TestNeuralLinearBandits(unittest.TestCase):
         ):
             self.assertTrue(torch.equal(p1.to(p2.device), p2))
 
+    def _learn_with_bf16_autocast(
+        self, device: torch.device
+    ) -> Tuple[NeuralLinearBandit, List[float], List[torch.dtype]]:
+        """
+        Trains a NeuralLinearBandit with bf16 autocast enabled on `device`, and returns
+        it with its training losses and the dtypes of the outputs of its NN layers.
+        """
+        feature_dim = 15
+        batch_size = feature_dim * 4
+        policy_learner = NeuralLinearBandit(
+            feature_dim=feature_dim,
+            hidden_dims=[16, 16],
+            learning_rate=0.01,
+            exploration_module=UCBExploration(alpha=0.1),
+            use_bf16_autocast=True,
+        ).to(device)
+        nn_output_dtypes = []
+        policy_learner.model._nn_layers.register_forward_hook(
+            lambda module, inputs, output: nn_output_dtypes.append(output.dtype)
+        )
+        state = torch.randn(batch_size, 3, device=device)
+        action = torch.randn(batch_size, feature_dim - 3, device=device)
+        batch = TransitionBatch(
+            state=state,
+            action=action,
+            reward=state.sum(-1, keepdim=True) + action.sum(-1, keepdim=True),
+            weight=torch.ones(batch_size, 1, device=device),
+        )
+        losses = [policy_learner.learn_batch(batch)["mlp_loss"] for _ in range(100)]
+        return policy_learner, losses, nn_output_dtypes
+
+    @unittest.skipUnless(torch.cuda.is_available(), "bf16 autocast requires a GPU")
+    def test_bf16_autocast(self) -> None:
+        policy_learner, losses, nn_output_dtypes = self._learn_with_bf16_autocast(
+            torch.device("cuda")
+        )
+        # the NN layers run in bfloat16 under autocast
+        self.assertTrue(all(dtype == torch.bfloat16 for dtype in nn_output_dtypes))
+        self.assertLess(losses[-1], losses[0])
+        # the linear regression layer is kept in FP32
+        linear_regression_layer = policy_learner.model._linear_regression_layer
+        self.assertEqual(linear_regression_layer._A.dtype, torch.float32)
+        self.assertEqual(linear_regression_layer.coefs.dtype, torch.float32)
+
+    def test_bf16_autocast_on_cpu(self) -> None:
+        _, _, nn_output_dtypes = self._learn_with_bf16_autocast(torch.device("cpu"))
+        # autocast is only enabled on GPUs, training on the CPU stays in FP32
+        self.assertTrue(all(dtype == torch.float32 for dtype in nn_output_dtypes))
+
     # currently test support mse, mae, cross_entropy
     # separate loss_types into inddividual test cases to make it easier to debug.
     def test_neural_linucb_mse_loss(self) -> None:
@@ -149,9 +204,14 @@ class TestNeuralLinearBandits(unittest.TestCase):
             reward=reward,
             weight=torch.ones(batch_size, 1),
         )
+        learn_batch = (
+            compile_function(policy_learner.learn_batch)
+            if RUN_TORCH_COMPILE_TESTS
+            else policy_learner.learn_batch
+        )
         losses = []
         for _ in range(epochs):
-            losses.append(policy_learner.learn_batch(batch)["mlp_loss"])
+            losses.append(learn_batch(batch)["mlp_loss"])
         if epochs >= NUM_EPOCHS:
             if loss_type == "mse":
                 self.assertGreater(1e-1, losses[-1])
@@ -163,15 +223,15 @@ class TestNeuralLinearBandits(unittest.TestCase):
                     losses[-1] < losses[0], "training loss should be decreasing"
                 )
 
+        action_space = DiscreteActionSpace(actions=batch.action)
         scores = policy_learner.get_scores(
             subjective_state=batch.state,
-            action_space=DiscreteActionSpace(actions=list(batch.action)),
+            action_space=action_space,
         )
         # shape should be batch_size, action_count
         self.assertEqual(scores.shape, (batch.state.shape[0], batch.action.shape[0]))
 
         # TEST ACT API
-        action_space = DiscreteActionSpace(actions=list(batch.action))
         # act on one state
         action = policy_learner.act(
             subjective_state=state[0], available_action_space=action_space
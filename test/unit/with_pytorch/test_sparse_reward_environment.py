@@ -27,7 +27,7 @@ class TestSparseRewardEnvironment(unittest.TestCase):
         self.assertEqual(4, action_space.n)
         # FIXME: private attributes should not be accessed.
         assert env._agent_position is not None
-        x, y = env._agent_position
+        x, y = env._agent_position.tolist()
         self.assertLess(x, 100)
         self.assertLess(y, 100)
         assert env._goal is not None
@@ -60,18 +60,78 @@ class TestSparseRewardEnvironment(unittest.TestCase):
         self.assertEqual(agent_position[1], y - 1)
 
         # Test win reward and terminate
-        env._agent_position = (goal_x, goal_y - 1)
+        env._agent_position = torch.tensor([goal_x, goal_y - 1])
         result = env.step(torch.tensor(1))
         self.assertEqual(result.reward, 0)
         self.assertTrue(result.terminated)
         # Test not win reward and not terminate
-        env._agent_position = (goal_x - 10, goal_y - 10)
+        env._agent_position = torch.tensor([goal_x - 10, goal_y - 10])
         result = env.step(torch.tensor(1))
         self.assertEqual(result.reward, -1)
         self.assertFalse(result.terminated)
         # Test not win reward and terminate
-        env._agent_position = (goal_x - 10, goal_y - 10)
+        env._agent_position = torch.tensor([goal_x - 10, goal_y - 10])
         env._step_count = env._max_episode_duration
         result = env.step(torch.tensor(1))
         self.assertEqual(result.reward, -1)
         self.assertTrue(result.terminated)
+
+        # Test position is clipped to the arena
+        env._agent_position = torch.tensor([0.0, 100.0])
+        env.step(torch.tensor(2))
+        env.step(torch.tensor(1))
+        self.assertTrue(torch.allclose(env._agent_position, torch.tensor([0.0, 100.0])))
+
+    def test_reached_goal(self) -> None:
+        env = DiscreteSparseRewardEnvironment(
+            length=100, height=100, step_size=1, action_count=4
+        )
+        env.reset()
+        # FIXME: private attributes should not be accessed.
+        assert env._goal is not None
+        goal_x, goal_y = env._goal
+        positions = torch.tensor(
+            [
+                [goal_x, goal_y],
+                [goal_x + 0.5, goal_y - 0.5],
+                [goal_x + 1.0, goal_y + 1.0],
+                [goal_x - 10, goal_y],
+            ]
+        )
+        self.assertTrue(
+            torch.equal(
+                env._reached_goal(positions),
+                torch.tensor([True, True, False, False]),
+            )
+        )
+
+    def test_action_deltas(self) -> None:
+        step_size = 0.5
+        env = DiscreteSparseRewardEnvironment(
+            length=100, height=100, step_size=step_size, action_count=8
+        )
+        # FIXME: private attributes should not be accessed.
+        self.assertEqual(env._actions.shape, (8, 2))
+        # every action moves the agent by exactly step_size
+        self.assertTrue(
+            torch.allclose(env._actions.norm(dim=1), torch.full((8,), step_size))
+        )
+        self.assertTrue(
+            torch.allclose(env._actions[2], torch.tensor([0.0, step_size]), atol=1e-7)
+        )
+        # batched lookup of the deltas of several actions
+        action_batch = torch.tensor([0, 2, 4, 6])
+        self.assertTrue(
+            torch.allclose(
+                env.action_deltas[action_batch],
+                torch.tensor(
+                    [
+                        [step_size, 0.0],
+                        [0.0, step_size],
+                        [-step_size, 0.0],
+                        [0.0, -step_size],
+                    ]
+                ),
+                atol=1e-7,
+            )
+        )
@@ -9,10 +9,14 @@
 This file contains helpers for unittest creation
 """
 
+import os
 from typing import Tuple
 
 import torch
 
+# torch.compile is slow to warm up, so tests exercising it are opt-in
+RUN_TORCH_COMPILE_TESTS: bool = os.environ.get("PEARL_TEST_TORCH_COMPILE", "0") == "1"
+
 
 # for testing vanilla mlps
 def create_normal_pdf_training_data(